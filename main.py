@@ -12,8 +12,9 @@ client = openreview.Client(
 
 invitation_id = 'ICLR.cc/2025/Conference/-/Submission'
 
-# Fetch the first 10 submissions
-submissions = client.get_notes(invitation=invitation_id, limit=10)
+# Fetch the first 10 submissions with their direct replies inlined, so the
+# reviews come back in the same request instead of one query per paper
+submissions = client.get_notes(invitation=invitation_id, limit=10, details='directReplies')
 
 # Prepare a list to store paper and review data
 papers_data = []
@@ -27,15 +28,21 @@ for submission in submissions:
         'Abstract': submission.content.get('abstract', {}).get('value', 'N/A'),
     }
     
-    # Fetch reviews for the current paper
-    reviews = client.get_notes(invitation=f'ICLR.cc/2025/Conference/-/Paper{submission.number}/Official_Review')
+    # Pick the reviews out of the inlined replies
+    replies = (submission.details or {}).get('directReplies', [])
+    reviews = [
+        reply for reply in replies
+        if any(invitation.endswith('Official_Review')
+               for invitation in reply.get('invitations', [reply.get('invitation', '')]))
+    ]
     for review in reviews:
-        paper_info.update({
-            'Reviewer': review.signatures[0],
-            'Rating': review.content.get('rating', 'N/A'),
-            'Review': review.content.get('review', 'N/A'),
+        # One fresh row per review: paper fields plus this review's fields
+        papers_data.append({
+            **paper_info,
+            'Reviewer': review['signatures'][0],
+            'Rating': review['content'].get('rating', 'N/A'),
+            'Review': review['content'].get('review', 'N/A'),
         })
-        papers_data.append(paper_info.copy())  # Append a copy of the paper info with review
 
 # Convert the list of dictionaries into a DataFrame
 df = pd.DataFrame(papers_data)
@@ -1,17 +1,26 @@
-# Install: pip install openreview-py pandas
+# Install: pip install openreview-py polars
 
+import argparse
 import openreview
-import pandas as pd
-import json
-import time
-from typing import List, Dict
+import orjson
+import polars as pl
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from tqdm import tqdm
+from collections import defaultdict
+from contextlib import closing, nullcontext
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import os
 import dotenv
 from datetime import datetime
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
-from src.utils.logger import get_logger, log_crawl_start, log_crawl_progress, log_crawl_complete, log_error_with_context
+from src.utils import logger as logger_module
+from src.utils.logger import get_logger, log_crawl_start, log_crawl_complete, log_error_with_context
+from src.utils.rate_limiter import AdaptiveRateLimiter, RateLimitedAdapter
 from src.schemas import Paper, Review, Comment, MetaReview, CrawlResult, create_paper_from_dict, create_crawl_result
 from pydantic import ValidationError
 
@@ -20,38 +29,155 @@ dotenv.load_dotenv()
 # Get logger for this module
 logger = get_logger(__name__)
 
+# Base URL of each OpenReview API version
+API_BASE_URLS = {'v2': 'https://api2.openreview.net', 'v1': 'https://api.openreview.net'}
+
+# Maximum number of forum requests in flight at the same time
+MAX_CONCURRENT_REQUESTS = 32
+
+# Shared limiter pacing every OpenReview HTTP request (see configure_http_session).
+# It runs at the OPENREVIEW_RATE_LIMIT ceiling (requests per second) and only backs
+# off when the API answers 429/503.
+rate_limiter = AdaptiveRateLimiter(max_rate=float(os.getenv('OPENREVIEW_RATE_LIMIT', '20')))
+
+# Details requested with the submissions so their replies come inlined in the
+# same paginated stream. Only API v2 returns every reply in the forum; API v1
+# only inlines direct replies, which would miss comments and rebuttals posted
+# under reviews, so v1 forums are fetched in full instead.
+REPLY_DETAILS = {'v2': 'replies'}
+
+# Content keys used to categorize forum notes
+_REVIEW_KEYS = frozenset({'rating', 'confidence', 'review', 'recommendation'})
+_META_KEYS = frozenset({'decision', 'recommendation'})
+_COMMENT_KEYS = frozenset({'comment', 'rebuttal'})
+
+# Common acceptance indicators for ICLR decisions
+_ACCEPTED_KEYWORDS = frozenset({'accept', 'oral', 'poster', 'spotlight', 'notable', 'top', 'best'})
+
+# Reject indicators, checked before the acceptance ones
+_REJECTED_KEYWORDS = frozenset({'reject', 'desk reject', 'withdraw'})
+
+# Paper fields dumped by save_data for the summary; review texts, comments and
+# meta-reviews are left out so they are not copied
+_SUMMARY_FIELDS = {
+    'paper_id': True, 'title': True, 'authors': True, 'num_reviews': True,
+    'decision': True, 'keywords': True, 'forum_url': True,
+    'reviews': {'__all__': {'rating'}},
+}
+
+# Column types of the summary table, so columns that are empty for every paper
+# (e.g. decision) keep a string type instead of Null
+_SUMMARY_SCHEMA = {
+    'paper_id': pl.Utf8, 'title': pl.Utf8, 'authors': pl.Utf8, 'num_reviews': pl.Int64,
+    'decision': pl.Utf8, 'keywords': pl.Utf8, 'forum_url': pl.Utf8,
+}
+
+# Note categories returned by classify_note
+NOTE_OTHER = 0
+NOTE_REVIEW = 1
+NOTE_META_REVIEW = 2
+NOTE_COMMENT = 3
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Make response.json() decode the body with orjson instead of the stdlib parser."""
+    response.json = lambda **json_kwargs: orjson.loads(response.content)
+    return response
+
+
+def configure_http_session(client, pool_size: int = MAX_CONCURRENT_REQUESTS):
+    """
+    Pace the client's requests through rate_limiter on a pooled session.
+
+    The adapter serving the API is replaced by a RateLimitedAdapter, so every HTTP
+    request (including each page of a paginated query) takes a limiter slot and
+    every 429/503 answer slows the limiter down. The replacement keeps the client's
+    own retry policy for other errors and at least its connection pool size, grown
+    to the number of concurrent forum fetches so worker threads reuse keep-alive
+    connections instead of paying a TCP + TLS handshake per request. Responses are
+    also hooked so the client's response.json() calls parse the large paginated
+    note payloads with orjson.
+
+    Args:
+        client: OpenReview client (v1 or v2)
+        pool_size: Minimum number of pooled connections per host
+
+    Returns:
+        requests.Session: The session used by the client
+    """
+    session = getattr(client, 'session', None) or requests.Session()
+    adapter = session.get_adapter(client.baseurl)
+    if not isinstance(adapter, RateLimitedAdapter):
+        session.mount(client.baseurl, RateLimitedAdapter(
+            rate_limiter,
+            pool_maxsize=max(pool_size, getattr(adapter, '_pool_maxsize', 0)),
+            max_retries=adapter.max_retries
+        ))
+    if _orjson_response_hook not in session.hooks['response']:
+        session.hooks['response'].append(_orjson_response_hook)
+    client.session = session
+    return session
+
+
+def create_openreview_client(api_version: str):
+    """
+    Create an OpenReview client for the given API version.
+
+    Credentials are read from the OPENREVIEW_USERNAME and OPENREVIEW_PASSWORD environment variables.
+
+    Args:
+        api_version: 'v2' or 'v1'
+
+    Returns:
+        OpenReview client for the requested API version
+    """
+    if api_version == 'v2':
+        return openreview.api.OpenReviewClient(baseurl=API_BASE_URLS['v2'],
+                                               username=os.getenv("OPENREVIEW_USERNAME"),
+                                               password=os.getenv("OPENREVIEW_PASSWORD"))
+    return openreview.Client(
+        baseurl=API_BASE_URLS['v1'],
+        username=os.getenv("OPENREVIEW_USERNAME"),
+        password=os.getenv("OPENREVIEW_PASSWORD")
+    )
+
 
 def get_openreview_client():
     """
-    Attempts to create an OpenReview client using API v2, falling back to API v1 if v2 fails.
+    Creates an OpenReview client for the API version selected by the OPENREVIEW_API environment variable.
 
-    This function tries to initialize an OpenReview client with the v2 API endpoint. If that raises an exception,
-    it falls back to the v1 API. It uses environment variables OPENREVIEW_USERNAME and OPENREVIEW_PASSWORD for authentication.
+    OPENREVIEW_API is 'v2' (default) or 'v1'. Authentication errors are raised rather than hidden by a
+    fallback; only when the v2 endpoint cannot be reached at all does this fall back to the v1 API.
 
     Returns:
         tuple: A tuple containing the OpenReview client object and a string indicating the API version ('v2' or 'v1').
     """
-    # Try API v2 first, fall back to v1
+    api_version = os.getenv('OPENREVIEW_API', 'v2').strip().lower()
+    if api_version not in API_BASE_URLS:
+        raise ValueError(f"Unsupported OPENREVIEW_API value: {api_version!r} (expected 'v2' or 'v1')")
+    
     try:
-        client = openreview.api.OpenReviewClient(baseurl='https://api2.openreview.net',
-                                                 username=os.getenv("OPENREVIEW_USERNAME"),
-    password=os.getenv("OPENREVIEW_PASSWORD"))
-        logger.info("Using OpenReview API v2")
-        return client, 'v2'
-    except:
-        client = openreview.Client(
-    baseurl='https://api.openreview.net',
-    username=os.getenv("OPENREVIEW_USERNAME"),
-    password=os.getenv("OPENREVIEW_PASSWORD")
-)
-        logger.info("Using OpenReview API v1")
-        return client, 'v1'
+        client = create_openreview_client(api_version)
+    except requests.exceptions.ConnectionError as e:
+        if api_version != 'v2':
+            raise
+        logger.warning(f"OpenReview API v2 is unreachable ({e}), falling back to v1")
+        api_version = 'v1'
+        client = create_openreview_client(api_version)
+    
+    configure_http_session(client)
+    logger.info(f"Using OpenReview API {api_version}")
+    return client, api_version
 
 
+@lru_cache(maxsize=None)
 def is_accepted_paper(decision):
     """
     Determine if a paper is accepted based on its decision
     
+    Results are memoized on the raw decision string, since a venue only uses a
+    handful of distinct decisions.
+    
     Args:
         decision: The decision string from the meta review
         
@@ -63,36 +189,288 @@ def is_accepted_paper(decision):
     
     decision_lower = str(decision).lower()
     
-    # Common acceptance indicators for ICLR
-    accepted_keywords = [
-        'accept', 'oral', 'poster', 'spotlight', 'notable', 'top', 'best'
-    ]
-    
-    # Reject indicators to be sure
-    rejected_keywords = [
-        'reject', 'desk reject', 'withdraw'
-    ]
-    
     # Check for rejection first
-    for reject_word in rejected_keywords:
-        if reject_word in decision_lower:
-            return False
+    if any(reject_word in decision_lower for reject_word in _REJECTED_KEYWORDS):
+        return False
     
     # Check for acceptance
-    for accept_word in accepted_keywords:
-        if accept_word in decision_lower:
-            return True
+    return any(accept_word in decision_lower for accept_word in _ACCEPTED_KEYWORDS)
+
+
+def get_value(content_dict, key):
+    """
+    Get a content field, unwrapping the {'value': ...} form used by API v2
+
+    Args:
+        content_dict: Note content dictionary
+        key: Field name
+
+    Returns:
+        The field value, or '' if missing
+    """
+    val = content_dict.get(key, '')
+    if isinstance(val, dict):
+        return val.get('value', '')
+    return val
+
+
+def extract_content(note):
+    """
+    Flatten a note's content, unwrapping the {'value': ...} form used by API v2
+
+    Args:
+        note: OpenReview note
+
+    Returns:
+        dict: Field name to value
+    """
+    content = {}
+    for key, val in note.content.items():
+        if isinstance(val, dict) and 'value' in val:
+            content[key] = val['value']
+        else:
+            content[key] = val
+    return content
+
+
+def as_str_list(value) -> List[str]:
+    """
+    Normalize an authors/keywords field to a list of strings
+
+    Strings are split on commas, the same way Paper.validate_authors and
+    Paper.validate_keywords normalize them.
+
+    Args:
+        value: List, single (possibly comma-separated) value, or empty value from the note content
+
+    Returns:
+        list: The field as a list of strings
+    """
+    if not value:
+        return []
+    if isinstance(value, list):
+        return [str(item).strip() for item in value if item]
+    return [item.strip() for item in str(value).split(',') if item.strip()]
+
+
+def classify_note(note_content) -> int:
+    """
+    Categorize a note based on its content keys rather than its invitation
+
+    Args:
+        note_content: Flattened note content from extract_content
+
+    Returns:
+        int: NOTE_REVIEW, NOTE_META_REVIEW, NOTE_COMMENT or NOTE_OTHER
+    """
+    # isdisjoint stops at the first shared key and builds no intermediate set
+    if not _REVIEW_KEYS.isdisjoint(note_content):
+        return NOTE_REVIEW
+    if not _META_KEYS.isdisjoint(note_content) and 'rating' not in note_content:
+        return NOTE_META_REVIEW
+    if not _COMMENT_KEYS.isdisjoint(note_content):
+        return NOTE_COMMENT
+    return NOTE_OTHER
+
+
+def get_inlined_replies(paper, api_version: str):
+    """
+    Get the replies inlined in a submission's details
+
+    Args:
+        paper: Submission note fetched with REPLY_DETAILS
+        api_version: 'v2' or 'v1'
+
+    Returns:
+        list: Reply notes, or None if the replies were not included
+    """
+    key = REPLY_DETAILS.get(api_version)
+    details = getattr(paper, 'details', None) or {}
+    replies = details.get(key) if key else None
+    if replies is None:
+        return None
+
+    note_class = openreview.api.Note if api_version == 'v2' else openreview.Note
+    return [note_class.from_json(reply) for reply in replies]
+
+
+def fetch_decisions(client, year: int) -> Dict[str, str]:
+    """
+    Fetch every decision of the conference in one bulk query
+
+    Args:
+        client: OpenReview client returned by get_openreview_client
+        year: Conference year
+
+    Returns:
+        dict: Forum ID to decision string, empty if the venue exposes no
+        conference-wide Decision invitation
+    """
+    invitation = f'ICLR.cc/{year}/Conference/-/Decision'
+    try:
+        decision_notes = client.get_all_notes(invitation=invitation)
+    except Exception as e:
+        logger.warning(f"Could not fetch decisions from {invitation}: {e}")
+        return {}
+    
+    return {note.forum: get_value(note.content, 'decision') for note in decision_notes}
+
+
+def get_decisions_path(year: int) -> str:
+    """Path of the decisions table written by crawl_decisions_only"""
+    return f'iclr_{year}_decisions.csv'
+
+
+def load_decisions(year: int) -> Dict[str, str]:
+    """
+    Load the decisions table written by crawl_decisions_only
+
+    Args:
+        year: Conference year
+
+    Returns:
+        dict: Forum ID to decision string, empty if no table has been written
+    """
+    path = get_decisions_path(year)
+    if not os.path.exists(path):
+        return {}
     
-    return False
+    table = pl.read_csv(path, schema={
+        'paper_id': pl.Utf8, 'forum_id': pl.Utf8, 'decision': pl.Utf8, 'accepted': pl.Boolean
+    })
+    return dict(zip(table['forum_id'].to_list(), table['decision'].to_list()))
 
 
-def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False):
+def crawl_decisions_only(year: int):
+    """
+    Fetch only the decisions of a conference and write them to iclr_{year}_decisions.csv
+
+    This takes seconds instead of hours, so the acceptance filtering can be checked
+    before a full crawl. A later accepted_only crawl reuses the written table.
+
+    Args:
+        year: Conference year
+
+    Returns:
+        pl.DataFrame: Table with paper_id, forum_id, decision and accepted columns,
+        or None if no decisions were found
+    """
+    client, _ = get_openreview_client()
+    decisions = fetch_decisions(client, year)
+    if not decisions:
+        logger.warning(f"No decisions found for ICLR {year}")
+        return None
+    
+    # Decisions reply to the submission, whose ID is also the forum ID
+    forum_ids = list(decisions)
+    table = pl.DataFrame({
+        'paper_id': forum_ids,
+        'forum_id': forum_ids,
+        'decision': list(decisions.values()),
+        'accepted': [is_accepted_paper(decision) for decision in decisions.values()],
+    }, schema={'paper_id': pl.Utf8, 'forum_id': pl.Utf8, 'decision': pl.Utf8, 'accepted': pl.Boolean})
+    
+    decisions_filename = get_decisions_path(year)
+    table.write_csv(decisions_filename)
+    logger.info(f"Saved {len(table)} decisions to {decisions_filename}")
+    return table
+
+
+def fetch_forum(client, api_version: str, forum_id: str):
+    """
+    Fetch all notes of a forum
+
+    Args:
+        client: OpenReview client returned by get_openreview_client
+        api_version: 'v2' or 'v1'
+        forum_id: Forum identifier of the paper
+
+    Returns:
+        list: All notes posted in the forum
+    """
+    if api_version == 'v2':
+        return list(client.get_all_notes(forum=forum_id))
+    return client.get_all_notes(forum=forum_id)
+
+
+def fetch_all_forums(client, api_version: str, forum_ids: List[str],
+                     max_concurrency: int = MAX_CONCURRENT_REQUESTS) -> Iterator[Tuple[str, Any]]:
+    """
+    Fetch the notes of many forums concurrently in a thread pool
+
+    Forums are yielded as their fetches complete, so each one can be processed
+    and checkpointed without waiting for the rest. If the caller stops early (or
+    is interrupted), fetches that have not started yet are cancelled.
+
+    Args:
+        client: OpenReview client returned by get_openreview_client
+        api_version: 'v2' or 'v1'
+        forum_ids: Forum identifiers to fetch
+        max_concurrency: Maximum number of requests in flight at once
+
+    Yields:
+        tuple: (forum_id, notes) in completion order. A failed fetch yields its
+        exception instead of a list of notes.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        futures = {
+            executor.submit(fetch_forum, client, api_version, forum_id): forum_id
+            for forum_id in forum_ids
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.exception() or future.result()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+
+
+def load_checkpoint(path: str) -> List[Paper]:
+    """
+    Load the papers already written to an NDJSON checkpoint file
+
+    A trailing line left incomplete by a crash is truncated from the file so new
+    papers can be appended cleanly; that paper is simply crawled again.
+
+    Args:
+        path: NDJSON file written by crawl_iclr_papers_and_reviews
+
+    Returns:
+        list: Validated Paper objects, empty if the file does not exist
+    """
+    if not os.path.exists(path):
+        return []
+    
+    papers: List[Paper] = []
+    with open(path, 'r+b') as f:
+        complete_bytes = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                logger.warning(f"Dropping incomplete last line of checkpoint {path}")
+                break
+            complete_bytes += len(line)
+            if not line.strip():
+                continue
+            try:
+                papers.append(create_paper_from_dict(orjson.loads(line)))
+            except (orjson.JSONDecodeError, ValidationError) as e:
+                log_error_with_context(e, f"loading checkpoint line from {path}")
+        f.truncate(complete_bytes)
+    
+    return papers
+
+
+def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False, output_path: Optional[str] = None):
     """
     Crawl papers and reviews from ICLR conference
     
     Args:
         year: Conference year (e.g., 2024, 2023, 2022)
         accepted_only: If True, only return accepted papers
+        output_path: Optional NDJSON file that each paper is written to as soon as it is crawled.
+            Papers already in this file are loaded and not processed again, so an
+            interrupted crawl resumes where it stopped.
     """
     client, api_version = get_openreview_client()
     
@@ -108,10 +486,11 @@ def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False):
     for pattern in patterns:
         logger.debug(f"Trying pattern: {pattern}")
         try:
+            details = REPLY_DETAILS.get(api_version)
             if api_version == 'v2':
-                submissions = list(client.get_all_notes(invitation=pattern))
+                submissions = list(client.get_all_notes(invitation=pattern, details=details))
             else:
-                submissions = client.get_all_notes(invitation=pattern)
+                submissions = client.get_all_notes(invitation=pattern, details=details)
             
             if submissions and len(submissions) > 0:
                 used_pattern = pattern
@@ -132,124 +511,160 @@ def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False):
     
     logger.info(f"Processing {len(submissions)} papers from {used_pattern}")
     
-    valid_papers: List[Paper] = []
+    valid_papers: List[Paper] = load_checkpoint(output_path) if output_path else []
     invalid_papers: List[Dict[str, str]] = []
+    done_ids = {paper_obj.paper_id for paper_obj in valid_papers}
+    if done_ids:
+        logger.info(f"Resuming from {output_path}: {len(done_ids)} papers already crawled")
     
-    for i, paper in enumerate(submissions, 1):
-        title = paper.content.get('title', {})
-        if isinstance(title, dict):
-            title = title.get('value', 'No title')
-        
-        log_crawl_progress(i, len(submissions), str(title)[:60])
-        
-        # Extract paper information (handle both v1 and v2 formats)
-        def get_value(content_dict, key):
-            val = content_dict.get(key, '')
-            if isinstance(val, dict):
-                return val.get('value', '')
-            return val
-        
-        paper_data = {
-            'paper_id': paper.id,
-            'forum_id': paper.forum if hasattr(paper, 'forum') else paper.id,
-            'title': str(title),
-            'abstract': get_value(paper.content, 'abstract'),
-            'authors': get_value(paper.content, 'authors'),
-            'keywords': get_value(paper.content, 'keywords'),
-            'pdf_url': f"https://openreview.net/pdf?id={paper.forum if hasattr(paper, 'forum') else paper.id}",
-            'forum_url': f"https://openreview.net/forum?id={paper.forum if hasattr(paper, 'forum') else paper.id}",
-        }
-        
-        # Get all notes for this paper (reviews, comments, etc.)
-        forum_id = paper.forum if hasattr(paper, 'forum') else paper.id
-        
-        try:
-            if api_version == 'v2':
-                notes = list(client.get_all_notes(forum=forum_id))
-            else:
-                notes = client.get_all_notes(forum=forum_id)
+    # Look up decisions in bulk so rejected papers are skipped before any notes are fetched,
+    # reusing the table from a previous --dry-run if there is one
+    decisions = {}
+    if accepted_only:
+        decisions = load_decisions(year) or fetch_decisions(client, year)
+    if decisions:
+        logger.info(f"Pre-filtering papers with {len(decisions)} decisions")
+    
+    # Replies normally come inlined with the submissions; only forums missing
+    # them are fetched separately, overlapping the HTTP round-trips
+    inlined = []
+    papers_by_forum = {}
+    for paper in submissions:
+        forum_id = getattr(paper, 'forum', paper.id)
+        if paper.id in done_ids or (decisions and not is_accepted_paper(decisions.get(forum_id))):
+            # Already crawled or rejected by the decision pre-filter
+            continue
+        replies = get_inlined_replies(paper, api_version)
+        if replies is None:
+            papers_by_forum[forum_id] = paper
+        else:
+            inlined.append((paper, replies))
+    
+    if papers_by_forum:
+        logger.info(f"Fetching notes for {len(papers_by_forum)} forums without inlined replies")
+    fetched = fetch_all_forums(client, api_version, list(papers_by_forum))
+    forum_notes = chain(inlined, ((papers_by_forum[forum_id], notes) for forum_id, notes in fetched))
+    
+    # Papers are streamed to output_path as NDJSON (one paper per line) as soon as
+    # they are assembled (fetched forums in completion order), which doubles as a
+    # checkpoint for resuming the crawl
+    progress = tqdm(forum_notes, total=len(inlined) + len(papers_by_forum), desc=f"ICLR {year}", unit="paper")
+    with closing(fetched), (open(output_path, 'ab') if output_path else nullcontext()) as stream:
+        for i, (paper, notes) in enumerate(progress, 1):
+            forum_id = getattr(paper, 'forum', paper.id)
             
-            reviews = []
-            comments = []
-            meta_reviews = []
-            decision = None
+            title = paper.content.get('title', {})
+            if isinstance(title, dict):
+                title = title.get('value', 'No title')
             
-            for note in notes:
-                # Skip the submission itself
-                if note.id == paper.id:
-                    continue
+            # Extract paper information (handle both v1 and v2 formats)
+            paper_data = {
+                'paper_id': paper.id,
+                'forum_id': forum_id,
+                'title': str(title),
+                'abstract': get_value(paper.content, 'abstract'),
+                'authors': as_str_list(get_value(paper.content, 'authors')),
+                'keywords': as_str_list(get_value(paper.content, 'keywords')),
+                'pdf_url': f"https://openreview.net/pdf?id={forum_id}",
+                'forum_url': f"https://openreview.net/forum?id={forum_id}",
+            }
+            
+            # Get all notes for this paper (reviews, comments, etc.)
+            try:
+                if isinstance(notes, Exception):
+                    raise notes
                 
-                invitation = note.invitation if hasattr(note, 'invitation') else ''
-                invitation_lower = str(invitation).lower()
+                reviews = []
+                comments = []
+                meta_reviews = []
+                decision = None
                 
-                # DEBUG: Print invitation patterns we're seeing
-                if i <= 3:  # Only for first few papers to avoid spam
-                    logger.debug(f"Note content keys: {list(note.content.keys())[:5]}")  # First 5 keys
+                for note in notes:
+                    # Skip the submission itself
+                    if note.id == paper.id:
+                        continue
+                    
+                    invitation = getattr(note, 'invitation', '')
+                    invitation_lower = str(invitation).lower()
+                    
+                    # DEBUG: Log content keys we're seeing
+                    if i <= 3 and logger_module.DEBUG_ENABLED:  # Only for first few papers to avoid spam
+                        logger.debug(f"Note content keys: {list(note.content.keys())[:5]}")  # First 5 keys
+                    
+                    # Extract content
+                    note_content = extract_content(note)
+                    category = classify_note(note_content)
+                    
+                    # Categorize the note based on content rather than invitation
+                    # Check if this looks like a review
+                    if category == NOTE_REVIEW:
+                        review_data = {
+                            'review_id': note.id,
+                            'invitation': invitation,
+                            'rating': note_content.get('rating', note_content.get('recommendation', '')),
+                            'confidence': note_content.get('confidence', ''),
+                            'summary': note_content.get('summary', ''),
+                            'soundness': note_content.get('soundness', ''),
+                            'presentation': note_content.get('presentation', ''),
+                            'contribution': note_content.get('contribution', ''),
+                            'strengths': note_content.get('strengths', ''),
+                            'weaknesses': note_content.get('weaknesses', ''),
+                            'questions': note_content.get('questions', ''),
+                            'limitations': note_content.get('limitations', ''),
+                            'review_text': note_content.get('review', ''),
+                        }
+                        reviews.append(review_data)
+                        
+                    # Check if this looks like a decision/meta-review
+                    elif category == NOTE_META_REVIEW:
+                        decision = note_content.get('decision', note_content.get('recommendation', ''))
+                        meta_reviews.append({
+                            'id': note.id,
+                            'decision': decision,
+                            'content': note_content
+                        })
+                        
+                    # Check if this looks like a comment
+                    elif category == NOTE_COMMENT:
+                        comments.append({
+                            'note_id': note.id,
+                            'invitation': invitation,
+                            'comment': note_content.get('comment', note_content.get('rebuttal', '')),
+                            'content': note_content
+                        })
                 
-                # Extract content
-                def extract_content(note):
-                    content = {}
-                    for key, val in note.content.items():
-                        if isinstance(val, dict) and 'value' in val:
-                            content[key] = val['value']
-                        else:
-                            content[key] = val
-                    return content
+                paper_data['reviews'] = reviews
+                paper_data['num_reviews'] = len(reviews)
+                paper_data['meta_reviews'] = meta_reviews
+                paper_data['decision'] = decision
+                paper_data['comments'] = comments
                 
-                note_content = extract_content(note)
+                progress.set_postfix(reviews=len(reviews), decision=str(decision)[:10])
+                if logger_module.DEBUG_ENABLED:
+                    logger.debug(f"Found {len(reviews)} reviews, {len(comments)} comments, decision: {decision}")
                 
-                # Categorize the note based on content rather than invitation
-                # Check if this looks like a review
-                if any(key in note_content for key in ['rating', 'confidence', 'review', 'recommendation']):
-                    review_data = {
-                        'review_id': note.id,
-                        'invitation': invitation,
-                        'rating': note_content.get('rating', note_content.get('recommendation', '')),
-                        'confidence': note_content.get('confidence', ''),
-                        'summary': note_content.get('summary', ''),
-                        'soundness': note_content.get('soundness', ''),
-                        'presentation': note_content.get('presentation', ''),
-                        'contribution': note_content.get('contribution', ''),
-                        'strengths': note_content.get('strengths', ''),
-                        'weaknesses': note_content.get('weaknesses', ''),
-                        'questions': note_content.get('questions', ''),
-                        'limitations': note_content.get('limitations', ''),
-                        'review_text': note_content.get('review', ''),
-                    }
-                    reviews.append(review_data)
-                    
-                # Check if this looks like a decision/meta-review
-                elif any(key in note_content for key in ['decision', 'recommendation']) and 'rating' not in note_content:
-                    decision = note_content.get('decision', note_content.get('recommendation', ''))
-                    meta_reviews.append({
-                        'id': note.id,
-                        'decision': decision,
-                        'content': note_content
-                    })
-                    
-                # Check if this looks like a comment
-                elif any(key in note_content for key in ['comment', 'rebuttal']):
-                    comments.append({
-                        'note_id': note.id,
-                        'invitation': invitation,
-                        'comment': note_content.get('comment', note_content.get('rebuttal', '')),
-                        'content': note_content
+                # Validate and create Paper object using Pydantic schema
+                try:
+                    paper_obj = create_paper_from_dict(paper_data)
+                    if logger_module.DEBUG_ENABLED:
+                        logger.debug(f"✓ Paper validated: {paper_obj.title[:50]}...")
+                except (ValidationError, Exception) as e:
+                    log_error_with_context(e, f"validating paper {paper.id}")
+                    invalid_papers.append({
+                        "paper_id": paper.id,
+                        "forum_id": paper_data.get("forum_id"),
+                        "title": str(title),
+                        "error": str(e)
                     })
-            
-            paper_data['reviews'] = reviews
-            paper_data['num_reviews'] = len(reviews)
-            paper_data['meta_reviews'] = meta_reviews
-            paper_data['decision'] = decision
-            paper_data['comments'] = comments
-            
-            logger.info(f"Found {len(reviews)} reviews, {len(comments)} comments, decision: {decision}")
-            
-            # Validate and create Paper object using Pydantic schema
-            try:
-                paper_obj = create_paper_from_dict(paper_data)
-                logger.debug(f"✓ Paper validated: {paper_obj.title[:50]}...")
-            except (ValidationError, Exception) as e:
-                log_error_with_context(e, f"validating paper {paper.id}")
+                    continue
+                
+            except Exception as e:
+                log_error_with_context(e, f"fetching notes for paper {paper.id}")
+                paper_data['reviews'] = []
+                paper_data['num_reviews'] = 0
+                paper_data['meta_reviews'] = []
+                paper_data['decision'] = None
+                paper_data['comments'] = []
                 invalid_papers.append({
                     "paper_id": paper.id,
                     "forum_id": paper_data.get("forum_id"),
@@ -258,38 +673,28 @@ def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False):
                 })
                 continue
             
-        except Exception as e:
-            log_error_with_context(e, f"fetching notes for paper {paper.id}")
-            paper_data['reviews'] = []
-            paper_data['num_reviews'] = 0
-            paper_data['meta_reviews'] = []
-            paper_data['decision'] = None
-            paper_data['comments'] = []
-            invalid_papers.append({
-                "paper_id": paper.id,
-                "forum_id": paper_data.get("forum_id"),
-                "title": str(title),
-                "error": str(e)
-            })
-            continue
-        
-        # Filter for accepted papers if requested
-        if accepted_only:
-            if is_accepted_paper(paper_obj.decision):
-                valid_papers.append(paper_obj)
-                logger.debug(f"Accepted paper included: {title[:50]}...")
+            # Filter for accepted papers if requested
+            if accepted_only:
+                if is_accepted_paper(paper_obj.decision):
+                    valid_papers.append(paper_obj)
+                    if logger_module.DEBUG_ENABLED:
+                        logger.debug(f"Accepted paper included: {title[:50]}...")
+                else:
+                    if logger_module.DEBUG_ENABLED:
+                        logger.debug(f"Rejected/withdrawn paper skipped: {title[:50]}...")
+                    continue
             else:
-                logger.debug(f"Rejected/withdrawn paper skipped: {title[:50]}...")
-        else:
-            valid_papers.append(paper_obj)
-        
-        # Rate limiting
-        time.sleep(0.3)
-        
-        # Optional: Limit for testing (remove this for full crawl)
-        # if i >= 5:
-        #     print("\n⚠ Stopping at 5 papers for testing. Remove limit for full crawl.")
-        #     break
+                valid_papers.append(paper_obj)
+            
+            if stream:
+                stream.write(orjson.dumps(paper_obj.model_dump(), default=str))
+                stream.write(b'\n')
+                stream.flush()
+            
+            # Optional: Limit for testing (remove this for full crawl)
+            # if i >= 5:
+            #     print("\n⚠ Stopping at 5 papers for testing. Remove limit for full crawl.")
+            #     break
     
     if invalid_papers:
         logger.warning(f"Skipped {len(invalid_papers)} papers due to validation errors or fetch issues.")
@@ -299,12 +704,15 @@ def crawl_iclr_papers_and_reviews(year: int, accepted_only: bool = False):
 
 
 def save_data(data: List, year: int, accepted_only: bool = False):
-    """Save crawled data to JSON and CSV files
+    """Save crawled data to a JSON file and its summary to CSV and Parquet files
     
     Args:
         data: List of Paper objects or dictionaries
         year: Conference year
         accepted_only: Whether only accepted papers were crawled
+    
+    Returns:
+        tuple: (summary pl.DataFrame, CrawlResult or None), or None if there is no data
     """
     
     if not data:
@@ -333,87 +741,128 @@ def save_data(data: List, year: int, accepted_only: bool = False):
     
     if crawl_result:
         # Save validated CrawlResult
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(crawl_result.model_dump(), f, indent=2, ensure_ascii=False, default=str)
+        with open(json_filename, 'wb') as f:
+            f.write(orjson.dumps(crawl_result.model_dump(), option=orjson.OPT_INDENT_2, default=str))
         logger.info(f"Saved validated CrawlResult to {json_filename}")
         papers_data = crawl_result.papers
     else:
         # Fall back to raw data
-        with open(json_filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        with open(json_filename, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
         logger.info(f"Saved raw data to {json_filename}")
         papers_data = data
     
-    # Create a flattened version for CSV
-    csv_data = []
-    for paper in papers_data:
+    # Create a flattened version for CSV, filling each column directly so Polars
+    # adopts the lists as columns without going through per-row dicts
+    num_papers = len(papers_data)
+    paper_ids = [None] * num_papers
+    titles = [None] * num_papers
+    authors_col = [None] * num_papers
+    num_reviews_col = [None] * num_papers
+    decisions = [None] * num_papers
+    keywords_col = [None] * num_papers
+    forum_urls = [None] * num_papers
+    # Reviews are gathered column-wise too, with paper_id as the foreign key
+    reviews_table = defaultdict(list)
+    for idx, paper in enumerate(papers_data):
         # Handle both Paper objects and dictionaries
         if hasattr(paper, 'model_dump'):
-            # It's a Paper object
-            paper_dict = paper.model_dump()
+            # It's a Paper object; dump only the fields the summary needs
+            paper_dict = paper.model_dump(include=_SUMMARY_FIELDS)
         else:
-            # It's a raw dictionary
-            paper_dict = paper
+            # It's a raw dictionary, which may not have been normalized
+            paper_dict = {
+                **paper,
+                'authors': as_str_list(paper.get('authors')),
+                'keywords': as_str_list(paper.get('keywords')),
+            }
         
-        # Calculate average rating if reviews exist
-        ratings = []
+        # Collect ratings so they can be parsed in a single vectorized pass
         for review in paper_dict.get('reviews', []):
             if hasattr(review, 'model_dump'):
                 review_dict = review.model_dump()
             else:
                 review_dict = review
-            
-            rating_str = str(review_dict.get('rating', ''))
-            if rating_str:
-                # Extract number from rating (various formats)
-                try:
-                    # Handle formats like "6: Weak Accept", "6", "6.0", etc.
-                    rating_clean = rating_str.split(':')[0].strip()
-                    rating_num = float(rating_clean)
-                    ratings.append(rating_num)
-                except:
-                    pass
+            reviews_table['paper_id'].append(paper_dict['paper_id'])
+            reviews_table['rating'].append(str(review_dict.get('rating', '')))
         
-        avg_rating = round(sum(ratings) / len(ratings), 2) if ratings else None
-        
-        authors = paper_dict.get('authors', [])
-        if isinstance(authors, list):
-            authors_str = ', '.join([str(a) for a in authors])
-        else:
-            authors_str = str(authors)
-        
-        keywords = paper_dict.get('keywords', [])
-        if isinstance(keywords, list):
-            keywords_str = ', '.join([str(k) for k in keywords])
-        else:
-            keywords_str = str(keywords)
-        
-        csv_data.append({
-            'paper_id': paper_dict['paper_id'],
-            'title': paper_dict['title'],
-            'authors': authors_str,
-            'num_reviews': paper_dict.get('num_reviews', len(paper_dict.get('reviews', []))),
-            'avg_rating': avg_rating,
-            'decision': paper_dict.get('decision', ''),
-            'keywords': keywords_str,
-            'forum_url': paper_dict.get('forum_url', '')
-        })
-    
-    # Save as CSV
-    df = pd.DataFrame(csv_data)
+        paper_ids[idx] = paper_dict['paper_id']
+        titles[idx] = paper_dict['title']
+        authors_col[idx] = paper_dict.get('authors') or []
+        num_reviews_col[idx] = paper_dict.get('num_reviews', len(paper_dict.get('reviews', [])))
+        decisions[idx] = paper_dict.get('decision', '')
+        keywords_col[idx] = paper_dict.get('keywords') or []
+        forum_urls[idx] = paper_dict.get('forum_url', '')
+    
+    # Authors and keywords are lists of strings, so joining needs no per-row type checks
+    authors_col = [', '.join(authors) for authors in authors_col]
+    keywords_col = [', '.join(keywords) for keywords in keywords_col]
+    
+    # Average the numeric part of ratings like "6: Weak Accept", "6" or "6.0" per paper
+    reviews = pl.DataFrame(reviews_table, schema={'paper_id': pl.Utf8, 'rating': pl.Utf8})
+    avg_ratings = (
+        reviews
+        .with_columns(pl.col('rating').str.extract(r'^\s*([-+]?\d*\.?\d+)', 1).cast(pl.Float64).alias('rating_num'))
+        .group_by('paper_id')
+        .agg(pl.col('rating_num').mean().round(2).alias('avg_rating'))
+    )
+    
+    df = (
+        pl.DataFrame({
+            'paper_id': paper_ids,
+            'title': titles,
+            'authors': authors_col,
+            'num_reviews': num_reviews_col,
+            'decision': decisions,
+            'keywords': keywords_col,
+            'forum_url': forum_urls,
+        }, schema=_SUMMARY_SCHEMA, strict=False)
+        .with_row_index('row')
+        .join(avg_ratings, on='paper_id', how='left')
+        .sort('row')
+        .select(['paper_id', 'title', 'authors', 'num_reviews', 'avg_rating', 'decision', 'keywords', 'forum_url'])
+    )
+    
+    # Save as CSV, plus a Parquet copy for analysis
     csv_filename = f'iclr_{year}_papers_summary{suffix}.csv'
-    df.to_csv(csv_filename, index=False, encoding='utf-8')
+    df.write_csv(csv_filename)
     logger.info(f"Saved summary to {csv_filename}")
+    
+    parquet_filename = f'iclr_{year}_papers_summary{suffix}.parquet'
+    df.write_parquet(parquet_filename)
+    logger.info(f"Saved summary to {parquet_filename}")
 
     return df, crawl_result
 
 
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl ICLR papers and reviews from OpenReview")
+    parser.add_argument('--year', type=int, default=2024, help="Conference year (default: 2024)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Only fetch the decisions table to check acceptance filtering")
+    args = parser.parse_args()
+    
     # Choose the year you want to crawl
-    YEAR = 2024  
+    YEAR = args.year
     ACCEPTED_ONLY = True  # Set to True to only crawl accepted papers
     
+    if args.dry_run:
+        decisions_table = crawl_decisions_only(YEAR)
+        if decisions_table is None:
+            print(f"\nNo decisions found for ICLR {YEAR}.")
+            exit(1)
+        
+        print(f"\nDecision histogram for ICLR {YEAR} ({len(decisions_table)} papers):")
+        counts = decisions_table.group_by(['decision', 'accepted']).len().sort('len', descending=True)
+        max_count = counts['len'].max()
+        for decision, accepted, count in counts.iter_rows():
+            bar = '#' * max(1, round(40 * count / max_count))
+            status = 'accepted' if accepted else 'rejected'
+            print(f"  {str(decision):<30} {count:>6} [{status}] {bar}")
+        print(f"\nAccepted: {decisions_table['accepted'].sum()} / {len(decisions_table)}")
+        exit(0)
+    
     print(f"{'='*60}")
     print(f"ICLR {YEAR} Paper & Review Crawler")
     if ACCEPTED_ONLY:
@@ -423,8 +872,13 @@ if __name__ == "__main__":
     # Log the start of crawling
     log_crawl_start("ICLR", YEAR)
 
-    # Crawl the data
-    data = crawl_iclr_papers_and_reviews(YEAR, accepted_only=ACCEPTED_ONLY)
+    # Crawl the data, streaming each paper to NDJSON as it is processed
+    suffix = "_accepted" if ACCEPTED_ONLY else ""
+    data = crawl_iclr_papers_and_reviews(
+        YEAR,
+        accepted_only=ACCEPTED_ONLY,
+        output_path=f'iclr_{YEAR}_papers_reviews{suffix}.jsonl'
+    )
     
     if not data:
         print("\nNo data collected. Try a different year.")
@@ -458,13 +912,13 @@ if __name__ == "__main__":
         else:
             # Fallback to basic statistics
             print(f"Total papers: {len(data)}")
-            print(f"Papers with reviews: {df['num_reviews'].gt(0).sum()}")
+            print(f"Papers with reviews: {(df['num_reviews'] > 0).sum()}")
             print(f"Average reviews per paper: {df['num_reviews'].mean():.2f}")
-            if df['avg_rating'].notna().any():
+            if df['avg_rating'].is_not_null().any():
                 print(f"Average rating: {df['avg_rating'].mean():.2f}")
             
             # Decision breakdown
-            if 'decision' in df.columns and df['decision'].notna().any():
+            if 'decision' in df.columns and df['decision'].is_not_null().any():
                 print(f"\nDecision breakdown:")
                 print(df['decision'].value_counts())
         
@@ -7,28 +7,105 @@ This module provides centralized logging configuration with support for:
 - Structured logging
 - Multiple log levels
 - Easy configuration for different environments
+
+Hot paths can skip even the call into a log helper when DEBUG is off by checking
+the module-level flag, which set_level()/setup_logging() keep current:
+
+    from src.utils import logger as logger_module
+
+    if logger_module.DEBUG_ENABLED:
+        log_function_call("fetch_reviews", {"forum_id": forum_id})
 """
 
+import atexit
 import logging
 import logging.handlers
+import os
+import re
+import reprlib
 import sys
+import time
 
 from pathlib import Path
+from queue import SimpleQueue
 from typing import Optional, Dict, Any
-import json
-from datetime import datetime
+
+# JSON serializer for the structured file logs: orjson, then ujson, then json.
+# All of them write non-ASCII text as UTF-8 instead of \u escapes.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    try:
+        import ujson
+
+        def _dumps(obj: Any) -> str:
+            return ujson.dumps(obj, ensure_ascii=False, default=str)
+    except ImportError:
+        import json
+
+        def _dumps(obj: Any) -> str:
+            return json.dumps(obj, ensure_ascii=False, default=str)
+
+# Source file logging uses to find the caller; setup_logging() clears it to skip
+# the per-record stack walk when caller info is not wanted
+_DEFAULT_SRCFILE = logging._srcfile
 
 
 class StructuredFormatter(logging.Formatter):
-    """Custom formatter that outputs structured JSON logs for better parsing."""
+    """Custom formatter that outputs structured JSON logs for better parsing.
+
+    Records are serialized with orjson or ujson when installed, falling back to the
+    standard library json module otherwise.
+    """
+
+    def __init__(self, *args, include_caller_info: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Whether to add the function/line/file fields of the caller
+        self.include_caller_info = include_caller_info
+        # Timestamp prefix (up to the seconds) of the last formatted second
+        self._cached_second = -1
+        self._cached_prefix = ''
+        # JSON-escaped file name per source pathname; only a handful of files log
+        self._file_names: Dict[str, str] = {}
+        # JSON-escaped logger names; get_logger accepts any string as a name
+        self._logger_names: Dict[str, str] = {}
 
     def format(self, record: logging.LogRecord) -> str:
+        # Records arrive in bursts within the same second, so the strftime
+        # prefix is only rebuilt when the second changes
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+
+        timestamp = f'{self._cached_prefix}.{int(record.msecs):03d}'
+        message = record.getMessage()
+
+        # Common case (no exception, no extra fields): the schema is fixed, so the
+        # JSON line is assembled directly and only the message needs escaping
+        if not record.exc_info and not hasattr(record, 'extra_fields'):
+            logger_name = self._logger_names.get(record.name)
+            if logger_name is None:
+                logger_name = self._logger_names[record.name] = _dumps(record.name)
+            line = (f'{{"timestamp":"{timestamp}","level":"{record.levelname}",'
+                    f'"logger":{logger_name},"message":{_dumps(message)}')
+            if self.include_caller_info:
+                file_name = self._file_names.get(record.pathname)
+                if file_name is None:
+                    file_name = self._file_names[record.pathname] = _dumps(record.filename)
+                return (f'{line},"function":"{record.funcName}","line":{record.lineno},'
+                        f'"file":{file_name}}}')
+            return line + '}'
+
         # Create base log entry
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': timestamp,
             'level': record.levelname,
             'logger': record.name,
-            'message': record.getMessage(),
+            'message': message,
         }
 
         # Add exception info if present
@@ -40,26 +117,161 @@ class StructuredFormatter(logging.Formatter):
             log_entry.update(record.extra_fields)
 
         # Add any additional fields that might be useful
-        if hasattr(record, 'funcName'):
+        if self.include_caller_info:
             log_entry['function'] = record.funcName
-        if hasattr(record, 'lineno'):
             log_entry['line'] = record.lineno
-        if hasattr(record, 'pathname'):
-            log_entry['file'] = Path(record.pathname).name
+            log_entry['file'] = record.filename
+
+        return _dumps(log_entry)
+
+
+# Logging level names accepted by the log_* helpers
+_LEVELS: Dict[str, int] = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Names identifying the handlers behind the queue listener
+CONSOLE_HANDLER_NAME = "console"
+FILE_HANDLER_NAME = "file"
+
+# Handler level that filters out every record
+MUTED_LEVEL = logging.CRITICAL + 1
+
+# Argument names whose values log_function_call masks
+_SENSITIVE_RE = re.compile(r'(?:password|token|secret|api[_-]?key)', re.I)
+
+# Bounded repr for logged argument values; stops formatting large objects (e.g.
+# whole paper dicts) once the limits are hit instead of stringifying them fully
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = 100
+_ARG_REPR.maxother = 100
+_ARG_REPR.maxlist = 5
+_ARG_REPR.maxdict = 5
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler for an in-process queue.
+
+    The stock QueueHandler formats every record on the calling thread so it can be
+    pickled; records here never leave the process, so only the message arguments
+    are merged and exc_info is kept for the listener-side formatters.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class FastRotatingHandler(logging.Handler):
+    """Size-based rotating file handler that tracks the file size in memory.
+
+    RotatingFileHandler seeks to the end of the file before every record to decide
+    whether to roll over; this handler counts the bytes it writes instead and
+    writes through a 64KB buffer, flushing immediately for ERROR and above.
+    """
+
+    def __init__(self, filename: Path, max_bytes: int, backup_count: int):
+        """Open the log file for appending.
+
+        Args:
+            filename: Path of the active log file
+            max_bytes: Size at which the file is rotated
+            backup_count: Number of rotated files to keep
+        """
+        super().__init__()
+        self.filename = os.fspath(filename)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._stream = open(self.filename, 'ab', buffering=64 * 1024)
+        self._bytes_written = os.path.getsize(self.filename)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = self.format(record).encode('utf-8') + b'\n'
+            self._stream.write(data)
+            if record.levelno >= logging.ERROR:
+                self._stream.flush()
+            self._bytes_written += len(data)
+            if self._bytes_written >= self.max_bytes:
+                self._rotate()
+        except Exception:
+            self.handleError(record)
+
+    def _rotate(self) -> None:
+        """Shift crawler.log -> crawler.log.1 -> ... and start a new file."""
+        self._stream.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            source = f"{self.filename}.{i}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.filename}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.filename, f"{self.filename}.1")
+        self._stream = open(self.filename, 'wb', buffering=64 * 1024)
+        self._bytes_written = 0
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self._stream.close()
+        super().close()
+
+
+class FastStdoutHandler(logging.Handler):
+    """Console handler writing UTF-8 lines straight to the stdout file descriptor.
+
+    Skips the sys.stdout TextIOWrapper (its lock and encoder); records are emitted
+    from the single QueueListener thread, so lines never interleave with each other.
+    Only used when sys.stdout is the process's file descriptor 1.
+    """
 
-        return json.dumps(log_entry, ensure_ascii=False)
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            data = (self.format(record) + '\n').encode('utf-8', 'replace')
+            # os.write may write less than requested to a pipe, so loop until done
+            while data:
+                data = data[os.write(1, data):]
+        except Exception:
+            self.handleError(record)
+
+
+def _stdout_is_fd1() -> bool:
+    """Check whether sys.stdout writes to file descriptor 1."""
+    try:
+        return sys.stdout.fileno() == 1
+    except (AttributeError, OSError, ValueError):
+        # No stdout, or a stream without a file descriptor (io.UnsupportedOperation)
+        return False
 
 
 class CrawlerLogger:
-    """Centralized logger configuration for the OpenReview crawler."""
+    """Centralized logger configuration for the OpenReview crawler.
+
+    The logger itself only enqueues records; formatting and I/O for the console and
+    file handlers happen on a QueueListener thread so crawler threads never wait on
+    the handler locks.
+    """
 
     def __init__(self, name: str = "openreview_crawler"):
         self.name = name
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)  # Set to lowest level, let handlers filter
 
-        # Prevent duplicate handlers
-        if self.logger.handlers:
+        # Prevent duplicate handlers by reusing the listener and formatters of a
+        # configured logger
+        configured = _configured_loggers.get(name)
+        if configured is not None:
+            self.listener = configured.listener
+            self.console_formatter = configured.console_formatter
+            self.file_formatter = configured.file_formatter
             return
 
         # Create formatters
@@ -70,60 +282,144 @@ class CrawlerLogger:
 
         self.file_formatter = StructuredFormatter()
 
-        # Setup handlers
-        self._setup_console_handler()
-        self._setup_file_handler()
+        # Setup handlers behind a queue listener. The C SimpleQueue is unbounded and
+        # put_nowait never blocks the crawler threads; that is fine here because the
+        # log rate is bounded by the latency of the HTTP requests being logged
+        log_queue = SimpleQueue()
+        self.logger.addHandler(LocalQueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(
+            log_queue,
+            self._setup_console_handler(),
+            self._setup_file_handler(),
+            respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+        _configured_loggers[name] = self
 
-    def _setup_console_handler(self) -> None:
+    def _setup_console_handler(self) -> logging.Handler:
         """Setup console logging handler."""
-        console_handler = logging.StreamHandler(sys.stdout)
+        if _stdout_is_fd1():
+            console_handler = FastStdoutHandler()
+        else:
+            # sys.stdout was replaced (captured, wrapped, ...); write through it
+            console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.set_name(CONSOLE_HANDLER_NAME)
         console_handler.setLevel(logging.INFO)  # Console shows INFO and above
         console_handler.setFormatter(self.console_formatter)
-        self.logger.addHandler(console_handler)
+        return console_handler
 
-    def _setup_file_handler(self) -> None:
-        """Setup rotating file handler for persistent logging."""
+    def _setup_file_handler(self) -> logging.Handler:
+        """Setup buffered rotating file handler for persistent logging."""
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
         log_dir.mkdir(exist_ok=True)
 
         # Rotating file handler (10MB per file, keep 5 backups)
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = FastRotatingHandler(
             log_dir / "crawler.log",
-            maxBytes=10 * 1024 * 1024,  # 10MB
-            backupCount=5,
-            encoding='utf-8'
+            max_bytes=10 * 1024 * 1024,  # 10MB
+            backup_count=5
         )
         file_handler.setLevel(logging.DEBUG)  # File logs everything
         file_handler.setFormatter(self.file_formatter)
-        self.logger.addHandler(file_handler)
+
+        # Buffer records and write them in batches; errors are written immediately
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+        buffered_handler.set_name(FILE_HANDLER_NAME)
+        buffered_handler.setLevel(logging.DEBUG)
+        atexit.register(buffered_handler.flush)
+        return buffered_handler
 
     def get_logger(self) -> logging.Logger:
         """Get the configured logger instance."""
         return self.logger
 
+    def flush_queue(self) -> None:
+        """Wait until the listener has handled every record queued so far.
+
+        Handler levels and formatter options are read on the listener thread, so
+        configuration changes drain the queue first. The handlers are flushed too,
+        so records held in the file handler's buffer are formatted and written
+        before the change; records logged before a change are then handled under
+        the configuration they were logged with.
+        """
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.flush()
+        self.listener.start()
+
     def set_level(self, level: str) -> None:
-        """Set the logging level for all handlers.
+        """Set the logging level for all enabled handlers.
 
         Args:
             level: Logging level ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         """
-        log_level = getattr(logging, level.upper(), logging.INFO)
-        self.logger.setLevel(log_level)
+        self.flush_queue()
+        self._apply_level(level)
 
-        # Update handler levels
-        for handler in self.logger.handlers:
-            if isinstance(handler, logging.StreamHandler):
-                # Console handler: INFO and above
-                handler.setLevel(max(log_level, logging.INFO))
-            else:
-                # File handler: use the set level
-                handler.setLevel(log_level)
+    def set_handler_enabled(self, name: str, enabled: bool) -> None:
+        """Mute or unmute the named handler.
+
+        Handlers are muted by raising their level above CRITICAL rather than being
+        detached, so toggling never mutates the listener's handler list.
+
+        Args:
+            name: CONSOLE_HANDLER_NAME or FILE_HANDLER_NAME
+            enabled: Whether the handler should receive records
+        """
+        self.flush_queue()
+        self._apply_handler_enabled(name, enabled)
 
+    def _apply_level(self, level: str) -> None:
+        """Set the logger and handler levels without draining the queue."""
+        global DEBUG_ENABLED
+
+        log_level = getattr(logging, level.upper(), logging.INFO)
+        self.logger.setLevel(log_level)
+        DEBUG_ENABLED = log_level <= logging.DEBUG
+
+        # Update handler levels, leaving muted handlers muted
+        for handler in self.listener.handlers:
+            if handler.level != MUTED_LEVEL:
+                handler.setLevel(self._handler_level(handler, log_level))
+
+    def _apply_handler_enabled(self, name: str, enabled: bool) -> None:
+        """Mute or unmute the named handler without draining the queue."""
+        for handler in self.listener.handlers:
+            if handler.name == name:
+                if enabled:
+                    handler.setLevel(self._handler_level(handler, self.logger.level))
+                else:
+                    handler.setLevel(MUTED_LEVEL)
+
+    @staticmethod
+    def _handler_level(handler: logging.Handler, log_level: int) -> int:
+        """Level a handler should use for the given logger level."""
+        if handler.name == CONSOLE_HANDLER_NAME:
+            # Console handler: INFO and above
+            return max(log_level, logging.INFO)
+        # File handler: use the set level
+        return log_level
+
+
+# Loggers whose handlers and queue listener are set up, keyed by logger name
+_configured_loggers: Dict[str, "CrawlerLogger"] = {}
+
+# Whether the crawler logger currently lets DEBUG records through
+DEBUG_ENABLED = False
 
 # Global logger instance
 _logger_instance: Optional[CrawlerLogger] = None
 
+# Child loggers returned by get_logger, keyed by name
+_child_cache: Dict[str, logging.Logger] = {}
+
 
 def get_logger(name: str = "openreview_crawler") -> logging.Logger:
     """Get or create the global logger instance.
@@ -134,20 +430,26 @@ def get_logger(name: str = "openreview_crawler") -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    global _logger_instance
+    cached = _child_cache.get(name)
+    if cached is not None:
+        return cached
 
     if _logger_instance is None:
-        _logger_instance = CrawlerLogger()
+        # First use: apply the default configuration
+        setup_logging()
 
     # Return child logger for the specific module
-    return _logger_instance.get_logger().getChild(name)
+    child = _logger_instance.get_logger().getChild(name)
+    _child_cache[name] = child
+    return child
 
 
 def setup_logging(
     level: str = "INFO",
     log_to_file: bool = True,
     log_to_console: bool = True,
-    structured_file_logs: bool = True
+    structured_file_logs: bool = True,
+    include_caller_info: bool = True
 ) -> logging.Logger:
     """Setup logging configuration.
 
@@ -156,6 +458,8 @@ def setup_logging(
         log_to_file: Whether to log to file
         log_to_console: Whether to log to console
         structured_file_logs: Whether to use JSON structured logs for files
+        include_caller_info: Whether to record the calling function/line/file;
+            disabling it skips the stack walk done for every record
 
     Returns:
         Root logger instance
@@ -165,21 +469,24 @@ def setup_logging(
     # Create logger instance
     _logger_instance = CrawlerLogger()
 
+    # Let records queued (or buffered) under the previous configuration be
+    # handled by it before the caller info settings below change
+    _logger_instance.flush_queue()
+
+    # The logs never include thread or process names, so skip collecting them
+    # for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = _DEFAULT_SRCFILE if include_caller_info else None
+    _logger_instance.file_formatter.include_caller_info = include_caller_info
+
     # Set level
-    _logger_instance.set_level(level)
+    _logger_instance._apply_level(level)
 
     # Configure handlers based on options
-    if not log_to_console:
-        # Remove console handler
-        for handler in _logger_instance.logger.handlers:
-            if isinstance(handler, logging.StreamHandler):
-                _logger_instance.logger.removeHandler(handler)
-
-    if not log_to_file:
-        # Remove file handler
-        for handler in _logger_instance.logger.handlers:
-            if isinstance(handler, logging.handlers.RotatingFileHandler):
-                _logger_instance.logger.removeHandler(handler)
+    _logger_instance._apply_handler_enabled(CONSOLE_HANDLER_NAME, log_to_console)
+    _logger_instance._apply_handler_enabled(FILE_HANDLER_NAME, log_to_file)
 
     return _logger_instance.get_logger()
 
@@ -193,19 +500,23 @@ def log_function_call(func_name: str, args: Dict[str, Any] = None, level: str =
         level: Logging level
     """
     logger = get_logger()
+    log_level = _LEVELS.get(level.upper(), logging.DEBUG)
+    if not logger.isEnabledFor(log_level):
+        return
+
     message = f"Calling {func_name}"
     if args:
         # Sanitize sensitive information
         safe_args = {}
         for key, value in args.items():
-            if 'password' in key.lower() or 'token' in key.lower():
+            if _SENSITIVE_RE.search(key):
                 safe_args[key] = "***"
             else:
-                safe_args[key] = str(value)[:100]  # Truncate long values
+                safe_args[key] = _ARG_REPR.repr(value)  # Truncate long values
 
         message += f" with args: {safe_args}"
 
-    getattr(logger, level.lower())(message)
+    logger.log(log_level, message)
 
 
 def log_performance(operation: str, duration: float, extra_info: Dict[str, Any] = None) -> None:
@@ -237,43 +548,57 @@ def log_api_call(endpoint: str, method: str = "GET", status_code: int = None,
         error: Error message if any
     """
     logger = get_logger("api")
+    if not logger.isEnabledFor(logging.ERROR if error else logging.INFO):
+        return
 
     if error:
-        logger.error(f"API call failed: {method} {endpoint} - {error}")
+        logger.error("API call failed: %s %s - %s", method, endpoint, error)
     else:
-        message = f"API call: {method} {endpoint}"
+        message = "API call: %s %s"
+        args = [method, endpoint]
         if status_code:
-            message += f" - Status: {status_code}"
+            message += " - Status: %s"
+            args.append(status_code)
         if duration:
-            message += f" - Duration: {duration:.2f}s"
+            message += " - Duration: %.2fs"
+            args.append(duration)
 
-        logger.info(message)
+        logger.info(message, *args)
 
 
 # Convenience functions for common logging patterns
 def log_crawl_start(venue: str, year: int, paper_count: int = None) -> None:
     """Log the start of a crawling operation."""
     logger = get_logger()
-    message = f"Starting crawl for {venue} {year}"
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     if paper_count:
-        message += f" ({paper_count} papers)"
-    logger.info(message)
+        logger.info("Starting crawl for %s %s (%s papers)", venue, year, paper_count)
+    else:
+        logger.info("Starting crawl for %s %s", venue, year)
 
 
 def log_crawl_progress(current: int, total: int, paper_title: str = None) -> None:
     """Log crawling progress."""
     logger = get_logger()
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     percentage = (current / total) * 100 if total > 0 else 0
-    message = f"Progress: {current}/{total} ({percentage:.1f}%)"
     if paper_title:
-        message += f" - {paper_title[:50]}..."
-    logger.info(message)
+        logger.info("Progress: %d/%d (%.1f%%) - %.50s...", current, total, percentage, paper_title)
+    else:
+        logger.info("Progress: %d/%d (%.1f%%)", current, total, percentage)
 
 
 def log_crawl_complete(venue: str, year: int, paper_count: int, duration: float) -> None:
     """Log completion of crawling operation."""
     logger = get_logger()
-    logger.info(f"Crawl completed for {venue} {year}: {paper_count} papers in {duration:.2f}s")
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    logger.info("Crawl completed for %s %s: %s papers in %.2fs", venue, year, paper_count, duration)
 
 
 def log_error_with_context(error: Exception, context: str = None, extra_data: Dict = None) -> None:
@@ -286,6 +611,3 @@ def log_error_with_context(error: Exception, context: str = None, extra_data: Di
 
     logger.error(message, exc_info=True)
 
-
-# Initialize default logging on import
-setup_logging()
@@ -0,0 +1,128 @@
+"""
+Adaptive rate limiting for OpenReview API requests.
+
+This module provides an AIMD (additive-increase/multiplicative-decrease) rate limiter:
+- Requests run at full speed up to a configurable ceiling
+- The rate is halved whenever the API answers with HTTP 429/503
+- The rate grows back additively, by about `increase` requests per second each second
+- Safe to share between the crawler's worker threads
+
+RateLimitedAdapter applies the limiter to every HTTP request of a requests session,
+including each page of a paginated query.
+"""
+
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError
+
+# HTTP status codes that mean the server wants us to slow down
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe AIMD rate limiter spacing request starts 1/rate seconds apart."""
+
+    def __init__(
+        self,
+        max_rate: float = 20.0,
+        min_rate: float = 0.5,
+        increase: float = 0.5,
+        decrease: float = 0.5
+    ):
+        """Create a limiter starting at its ceiling.
+
+        Args:
+            max_rate: Ceiling in requests per second
+            min_rate: Floor in requests per second
+            increase: Requests per second added per second of successful requests
+            decrease: Factor the rate is multiplied by when throttled
+        """
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.rate = max_rate
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def acquire(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + 1.0 / self.rate
+
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_success(self) -> None:
+        """Additively raise the rate after a successful request.
+
+        Each success adds increase/rate, so the rate climbs by about `increase`
+        per second however fast requests complete, instead of snapping back to
+        the ceiling within a few dozen requests after a halving.
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def record_throttled(self) -> None:
+        """Multiplicatively lower the rate after the server throttled a request."""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter sending every request through an AdaptiveRateLimiter.
+
+    Throttling answers (429/503) are taken out of urllib3's retry policy and handled
+    here instead, so each one reaches the limiter. A throttled request is re-sent
+    with the budget and backoff of the original retry policy: after its Retry-After
+    delay when the server sends one, otherwise after an exponential backoff.
+    """
+
+    def __init__(self, limiter: AdaptiveRateLimiter, throttle_retries: int = 3, **kwargs):
+        """Create the adapter.
+
+        Args:
+            limiter: Limiter shared by every request sent through the adapter
+            throttle_retries: Minimum number of re-sends after throttling answers
+            **kwargs: HTTPAdapter arguments (pool_maxsize, max_retries, ...)
+        """
+        super().__init__(**kwargs)
+        self.limiter = limiter
+
+        # Retry policy for throttling answers: the original one, with at least
+        # throttle_retries tries and a non-zero backoff
+        throttle_retry = self.max_retries
+        if isinstance(throttle_retry.total, int) and throttle_retry.total < throttle_retries:
+            throttle_retry = throttle_retry.new(total=throttle_retries)
+        if not throttle_retry.backoff_factor:
+            throttle_retry = throttle_retry.new(backoff_factor=1)
+        self.throttle_retry = throttle_retry
+
+        retry_codes = self.max_retries.status_forcelist or ()
+        self.max_retries = self.max_retries.new(
+            status_forcelist=[code for code in retry_codes if code not in THROTTLE_STATUS_CODES],
+            respect_retry_after_header=False
+        )
+
+    def send(self, request, **kwargs):
+        retries = self.throttle_retry
+        while True:
+            self.limiter.acquire()
+            response = super().send(request, **kwargs)
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                self.limiter.record_success()
+                return response
+
+            self.limiter.record_throttled()
+            try:
+                retries = retries.increment(request.method, request.url, response=response.raw)
+            except MaxRetryError:
+                return response
+            # Waits for Retry-After if present, otherwise for the exponential backoff
+            retries.sleep(response.raw)
+            response.close()